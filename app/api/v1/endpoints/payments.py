@@ -28,8 +28,8 @@ async def initialize_payment(payload: PaymentInitializeRequest) -> GenericApiRes
             payment_intent=result["payment_intent"],
         )
 
-        print(f"response_data: {response_data}")
-        
+        logger.debug("Payment initialize response: %s", response_data)
+
         return GenericApiResponse(
             success=True,
             message="Payment intent created successfully",
@@ -37,7 +37,7 @@ async def initialize_payment(payload: PaymentInitializeRequest) -> GenericApiRes
         )
         
     except Exception as e:
-        logger.error(f"Payment initialization failed: {e}")
+        logger.error("Payment initialization failed: %s", e)
         return GenericApiResponse(
             success=False,
             message="Failed to initialize payment",
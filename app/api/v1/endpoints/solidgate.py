@@ -1,6 +0,0 @@
-'''
-
-i was planing to create endpoint for signature test 
-but i think we cannot use it for hoisted testing?
-
-'''
\ No newline at end of file
@@ -1,9 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+import asyncio
 
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
 from app.core.dependencies import get_unit_of_work
 from app.core.unit_of_work import UnitOfWork
-from app.schemas.webhook import WebhookEventCreate, WebhookEventResponse
-from app.schemas.common import GenericApiResponse
+from app.schemas.webhook import WebhookAck, WebhookEventCreate
 from app.services.idempotency_service import IdempotencyService
 from app.services.medusa_service import medusa_service
 
@@ -13,113 +17,129 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# @router.post('/solidgate_webhook')
-# async def solidgate_webhook(request: Request, db: Session = Depends(get_db_session)):
-#     try:
-#         body = await request.json()
-
-
-#         order = body.get("order", {})
-#         order_id = order.get("order_id", "")
-#         order_status = order.get("status", "")
-
-#         idempotency = await idempotency_service.create_webhook_event(db, WebhookEventCreate(
-#             psp="solidgate",
-#             event_type=request.headers.get("solidgate-event-type"),
-#             event_id=request.headers.get("solidgate-event-id"),
-#             medusa_order_id=order_id,
-#             processed=True,
-#             payload=body,
-#         ))
-
-#         if not idempotency:
-#             logger.error(f"Webhook event log already exists for idempotency key: {request.headers.get('solidgate-event-id')}")
-#             return {"message": "Webhook event log already exists", "received": body}
-
-#         if order_status == "settle_ok":
-#             result = await medusa_service.process_settle_ok(order_id)
-
-#             if not result:
-#                 raise HTTPException(
-#                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-#                     detail="An unexpected error occurred"
-#                 )
-
-#             return result
-        
-#         return GenericApiResponse(
-#             success=True,
-#             message="solidgate_webhook call success", 
-#             status_code=status.HTTP_201_CREATED,
-#             data=body
-#         )
-    
-#     except Exception as e:
-#         logger.error(f"Webhook error: {e}")  # ✅ Now you can see real error
-#         import traceback
-#         traceback.print_exc()  # ✅ Full traceback
-#         raise HTTPException(
-#             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-#             detail="An unexpected error occurred"
-#         )
-
-@router.post("/solidgate", response_model=WebhookEventResponse)
+# caps in-flight Medusa settlement work so webhook bursts can't exhaust
+# the DB pool or pile unbounded load onto Medusa
+_settle_ok_semaphore = asyncio.Semaphore(settings.SETTLE_OK_CONCURRENCY)
+
+async def _process_settle_ok(webhook_event_id: str, cart_id: str) -> None:
+    async with _settle_ok_semaphore:
+        try:
+            result = await medusa_service.process_settle_ok(cart_id)
+        except Exception as e:
+            logger.error("settle_ok processing error for cart %s: %s", cart_id, e)
+            result = None
+
+    if not result:
+        logger.error("settle_ok processing failed for cart: %s", cart_id)
+
+    # runs outside the request scope, so it needs its own unit of work
+    try:
+        uow = UnitOfWork(AsyncSessionLocal)
+        async with uow:
+            if result:
+                await uow.webhook_events.mark_as_processed(webhook_event_id)
+            else:
+                await uow.webhook_events.mark_as_failed(
+                    webhook_event_id,
+                    f"settle_ok failed for cart {cart_id}",
+                )
+            await uow.commit()
+    except Exception as e:
+        logger.error(
+            "Failed to record settle_ok outcome for event %s: %s",
+            webhook_event_id, e
+        )
+
+def _queue_settle_ok(
+    background_tasks: BackgroundTasks,
+    webhook_event_id: str,
+    cart_id: str
+) -> WebhookAck:
+    background_tasks.add_task(_process_settle_ok, webhook_event_id, cart_id)
+    return WebhookAck(message="Queued for settlement")
+
+# order status -> handler; new statuses get an entry here instead of
+# growing the endpoint body
+_STATUS_HANDLERS = {
+    "settle_ok": _queue_settle_ok,
+}
+
+@router.post(
+    "/solidgate",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=WebhookAck,
+)
 async def handle_solidgate_webhook(
     request: Request,
+    background_tasks: BackgroundTasks,
     uow: UnitOfWork = Depends(get_unit_of_work)
 ):
 
-    payload = await request.json()
-
-    print("=" * 80)
-    print("=" * 80)
-    print("=" * 80)
-    print("")
-    print("")
-    print(payload)
-    print("")
-    print("")
-    print("=" * 80)
-    print("=" * 80)
-    print("=" * 80)
-    print(f"request.headers.get(solidgate-event-type): {request.headers.get("solidgate-event-type")}")
-    print(f"request.headers.get(solidgate-event-id): {request.headers.get("solidgate-event-id")}")
-    print("=" * 80)
-    print("=" * 80)
-
-    order = payload.get("order", {})
-    cart_id = order.get("order_id") #cart_id we cant really change the structure
-    order_status = order.get("status")
-
-    webhook_data = WebhookEventCreate(
-        event_id=request.headers.get("solidgate-event-id"),
-        psp="solidgate",
-        event_type=request.headers.get("solidgate-event-type"),
-        medusa_order_id=cart_id, # will change this to cart_id later including column name
-        payload=payload,
-    )
+    event_id = request.headers.get("solidgate-event-id")
+    event_type = request.headers.get("solidgate-event-type")
+
+    if not event_id or not event_type:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Missing solidgate event headers"
+        )
 
     service = IdempotencyService(uow)
-    idempotency_result = await service.check_and_create_webhook_event(webhook_data)
-    
-    if idempotency_result is None:
-            logger.info(f"Webhook already processed: {webhook_data.event_id}")
-            return {"message": "Event already processed"}
 
-    if order_status == "settle_ok":
-        result = await medusa_service.process_settle_ok(cart_id)
+    # duplicates are decided from the header alone, before the body is read
+    if await service.reserve_event(event_id) is False:
+        logger.info("Webhook already processed: %s", event_id)
+        return WebhookAck(message="Event already processed")
+
+    # once reserved, any failure before the DB row exists must release the
+    # reservation, or the PSP retry gets acked as a duplicate for the next 24h
+    try:
+        raw_body = await request.body()
+
+        try:
+            payload = orjson.loads(raw_body)
+        except orjson.JSONDecodeError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid JSON body"
+            )
 
-        if not result:
+        if not isinstance(payload, dict):
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to process settle_ok"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Webhook body must be a JSON object"
             )
 
-        return result
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Solidgate webhook event_type=%s event_id=%s payload=%s",
+                event_type, event_id, payload,
+            )
+
+        order = payload.get("order", {})
+        cart_id = order.get("order_id") #cart_id we cant really change the structure
+        order_status = order.get("status")
+
+        # inputs are validated above, so skip pydantic field validation
+        webhook_data = WebhookEventCreate.model_construct(
+            event_id=event_id,
+            psp="solidgate",
+            event_type=event_type,
+            medusa_order_id=cart_id, # will change this to cart_id later including column name
+            payload=payload,
+        )
+
+        idempotency_result = await service.check_and_create_webhook_event(webhook_data)
+    except Exception:
+        await service.release_event(event_id)
+        raise
+
+    if idempotency_result is None:
+        logger.info("Webhook already processed: %s", webhook_data.event_id)
+        return WebhookAck(message="Event already processed")
+
+    handler = _STATUS_HANDLERS.get(order_status)
+    if handler:
+        return handler(background_tasks, idempotency_result.id, cart_id)
 
-    return GenericApiResponse(
-        success=True,
-        message="Webhook processed",
-        status_code=status.HTTP_200_OK,
-        data=payload
-    )
+    return WebhookAck(message="Webhook received")
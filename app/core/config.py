@@ -1,6 +1,10 @@
-from pydantic import Field, field_validator
+from functools import cached_property, lru_cache
+
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+_ALLOWED_ENVS = frozenset({"development", "staging", "production"})
+
 
 class Settings(BaseSettings):
     APP_NAME: str = "Medusa x Solidgate Payment Orchestrator"
@@ -33,6 +37,8 @@ class Settings(BaseSettings):
     MEDUSA_ADMIN_PASSWORD: str
     MEDUSA_TOKEN_CACHE_TTL: int = 82800
     MEDUSA_PUBLISHABLE_KEY: str
+
+    SETTLE_OK_CONCURRENCY: int = 8
     
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -41,21 +47,21 @@ class Settings(BaseSettings):
         extra="ignore",
     )
     
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
         if self.CORS_ORIGINS == "*":
             return ["*"]
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
     
-    @property
+    @cached_property
     def is_production(self) -> bool:
         return self.ENVIRONMENT.lower() == "production"
     
-    @property
+    @cached_property
     def is_development(self) -> bool:
         return self.ENVIRONMENT.lower() == "development"
     
-    @property
+    @cached_property
     def database_url_sync(self) -> str:
         return self.DATABASE_URL.replace("+asyncpg", "")
     
@@ -69,9 +75,12 @@ class Settings(BaseSettings):
     @field_validator("ENVIRONMENT")
     @classmethod
     def validate_environment(cls, v: str) -> str:
-        allowed = ["development", "staging", "production"]
-        if v.lower() not in allowed:
-            raise ValueError(f"ENVIRONMENT must be one of: {allowed}")
+        if v.lower() not in _ALLOWED_ENVS:
+            raise ValueError(f"ENVIRONMENT must be one of: {sorted(_ALLOWED_ENVS)}")
         return v.lower()
 
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
+
+settings = get_settings()
\ No newline at end of file
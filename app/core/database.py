@@ -1,6 +1,5 @@
 from typing import AsyncGenerator
 from uuid import uuid4
-from sqlalchemy.pool import NullPool
 
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -8,7 +7,6 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy import text
 
 from app.core.config import settings
@@ -16,7 +14,11 @@ from app.core.config import settings
 
 engine: AsyncEngine = create_async_engine(
     url=settings.DATABASE_URL,
-    poolclass=NullPool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
     echo=settings.DB_ECHO,
     connect_args={
         "statement_cache_size": 0,
@@ -31,19 +33,6 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
-# wont remove since this was the working part 
-
-# async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-#     session = AsyncSessionLocal()
-#     try:
-#         yield session
-#         await session.commit()
-#     except Exception:
-#         await session.rollback()
-#         raise
-#     finally:
-#         await session.close()
-
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         try:
@@ -52,18 +41,6 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             await session.rollback()
             raise
 
-# async def check_db_health() -> dict | None:
-#     session = AsyncSessionLocal()
-#     try:
-#         result = await session.execute(text("SELECT version()"))
-#         version = result.scalar()
-#         return {"status": "healthy", "version": version}
-#     except Exception as e:
-#         print(f"Database health check failed: {e}")
-#         return False 
-#     finally:
-#         await session.close()
-    
 async def check_db_health() -> dict | None:
     async with AsyncSessionLocal() as session:
         try:
@@ -0,0 +1,40 @@
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClient:
+    def __init__(self):
+        self._client: httpx.AsyncClient | None = None
+
+    def _build_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+            ),
+            timeout=30.0,
+        )
+
+    async def connect(self) -> None:
+        self._client = self._build_client()
+        logger.info("Shared HTTP client started")
+
+    async def disconnect(self) -> None:
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+            logger.info("Shared HTTP client closed")
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # fallback for callers running outside the app lifespan (scripts, tests)
+        if self._client is None:
+            self._client = self._build_client()
+        return self._client
+
+
+http_client = HttpClient()
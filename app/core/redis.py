@@ -20,7 +20,7 @@ class RedisClient:
             await self._client.ping()
             logger.info("Redis connected successfully")
         except Exception as e:
-            logger.error(f"Redis connection failed: {e}")
+            logger.error("Redis connection failed: %s", e)
             self._client = None
 
     async def disconnect(self) -> None:
@@ -34,7 +34,7 @@ class RedisClient:
         try:
             return await self._client.get(key)
         except Exception as e:
-            logger.error(f"Redis get error: {e}")
+            logger.error("Redis get error: %s", e)
             return None
 
     async def set(
@@ -49,9 +49,23 @@ class RedisClient:
             await self._client.set(key, value, ex=ttl)
             return True
         except Exception as e:
-            logger.error(f"Redis set error: {e}")
+            logger.error("Redis set error: %s", e)
             return False
 
+    async def set_if_not_exists(
+        self,
+        key: str,
+        value: str,
+        ttl: int | None = None
+    ) -> bool | None:
+        if not self._client:
+            return None
+        try:
+            return bool(await self._client.set(key, value, ex=ttl, nx=True))
+        except Exception as e:
+            logger.error("Redis setnx error: %s", e)
+            return None
+
     async def delete(self, key: str) -> bool:
         if not self._client:
             return False
@@ -59,7 +73,7 @@ class RedisClient:
             await self._client.delete(key)
             return True
         except Exception as e:
-            logger.error(f"Redis delete error: {e}")
+            logger.error("Redis delete error: %s", e)
             return False
 
 
@@ -26,7 +26,7 @@ async def create_webhook_event(
         
     except Exception as e:
         await db.rollback()
-        logger.error(f"Failed to create webhook_event: {str(e)}")
+        logger.error("Failed to create webhook_event: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred"
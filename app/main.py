@@ -1,12 +1,15 @@
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
 from app.core.database import engine
 from app.api.v1.api import api_router
+from app.core.http import http_client
 from app.core.redis import redis_client
 
 
@@ -21,14 +24,17 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     logger.info("Starting up...")
     await redis_client.connect()
+    await http_client.connect()
     yield
     logger.info("Shutting down...")
+    await http_client.disconnect()
     await redis_client.disconnect()
     await engine.dispose()
 
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -42,10 +48,13 @@ app.add_middleware(
 
 app.include_router(api_router, prefix="/api/v1")
 
+_ROOT_BODY = orjson.dumps({"message": "Welcome to the jungle"})
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
+
 @app.get("/")
 def root():
-    return {"message": f"Welcome to the jungle"}
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    return Response(content=_HEALTH_BODY, media_type="application/json")
\ No newline at end of file
@@ -1,12 +1,15 @@
-import uuid
+import os
+import time
 from datetime import datetime
 
-from sqlalchemy import DateTime, func 
+from sqlalchemy import DateTime, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
 def generate_prefixed_id(prefix: str) -> str:
-    return f"{prefix}_{uuid.uuid4().hex}"
+    # uuid7-style: millisecond timestamp prefix keeps ids roughly ordered,
+    # so the primary-key index grows append-mostly instead of randomly
+    return f"{prefix}_{time.time_ns() // 1_000_000:012x}{os.urandom(10).hex()}"
 
 
 class Base(DeclarativeBase):
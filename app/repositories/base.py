@@ -1,6 +1,6 @@
 from typing import Any, Generic, Sequence, TypeVar 
 
-from sqlalchemy import select, update, delete 
+from sqlalchemy import insert, select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession 
 
 from app.models.base import Base 
@@ -29,20 +29,24 @@ class BaseRepository(Generic[ModelType]):
         return result.scalars().all()
     
     async def create(self, **kwargs: Any) -> ModelType:
-        instance = self.model(**kwargs)
-        self.session.add(instance)
-        await self.session.flush()
-        return instance 
+        result = await self.session.execute(
+            insert(self.model)
+            .values(**kwargs)
+            .returning(self.model)
+        )
+
+        return result.scalar_one()
     
     async def update_by_id(self, id: str, **kwargs: Any) -> ModelType | None:
-        await self.session.execute(
+        result = await self.session.execute(
             update(self.model)
             .where(self.model.id == id)
             .values(**kwargs)
+            .returning(self.model)
         )
 
         await self.session.flush()
-        return await self.get_by_id(id)
+        return result.scalar_one_or_none()
     
 
     async def delete_by_id(self, id:str) -> bool:
@@ -1,4 +1,7 @@
-from sqlalchemy import select, update
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.models.webhook import WebhookEvent
 from app.repositories.base import BaseRepository
@@ -8,6 +11,20 @@ class WebhookEventRepository(BaseRepository[WebhookEvent]):
     def __init__(self, session):
         super().__init__(WebhookEvent, session)
 
+    async def create_if_new(self, **kwargs: Any) -> WebhookEvent | None:
+        '''
+        single-statement existence check + insert; None means the
+        event_id was already recorded
+        '''
+        result = await self.session.execute(
+            pg_insert(WebhookEvent)
+            .values(**kwargs)
+            .on_conflict_do_nothing(index_elements=["event_id"])
+            .returning(WebhookEvent)
+        )
+
+        return result.scalar_one_or_none()
+
     async def get_by_event_id(self, event_id:str) -> WebhookEvent | None:
         result = await self.session.execute(
             select(WebhookEvent)
@@ -1 +0,0 @@
-from app.schemas.common import GenericApiResponse
\ No newline at end of file
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from fastapi import status
-from typing import Optional, Dict, Any
+from typing import Dict, Any
 
 class MessageResponse(BaseModel):
     message: str
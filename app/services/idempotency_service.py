@@ -1,62 +1,61 @@
-import logging 
+import logging
 
+from app.core.redis import redis_client
 from app.core.unit_of_work import UnitOfWork
 from app.schemas.webhook import WebhookEventCreate, WebhookEventResponse
 
 logger = logging.getLogger(__name__)
-# from app.crud import (
-#     webhook_events as webhook_events_crud
-# )
-# from sqlalchemy.orm import Session
+
+EVENT_SEEN_KEY_PREFIX = "wh:event:"
+EVENT_SEEN_TTL = 86400  # covers Solidgate's retry window
+
+def _row_to_response(row) -> WebhookEventResponse:
+    # the row came straight from our own insert; skip pydantic re-validation
+    return WebhookEventResponse.model_construct(
+        **{
+            name: getattr(row, name)
+            for name in WebhookEventResponse.model_fields
+            if hasattr(row, name)
+        }
+    )
 
 class IdempotencyService:
     def __init__(self, uow: UnitOfWork):
         self.uow = uow
 
-    # async def create_webhook_event(
-    #         self,
-    #         db: Session,
-    #         webhook_event_log: WebhookEventCreate
-    #     ) -> WebhookEventResponse:
-    #     try:
-
-    #         print(f"webhook_event_log: {webhook_event_log}")
-
-    #         existing_webhook = await webhook_events_crud.get_webhook_event_by_event_id(
-    #             db,
-    #             webhook_event_log.event_id
-    #         )
-    #         if existing_webhook:
-    #             logger.info(f"Webhook event log already exists: {webhook_event_log.event_id}")
-    #             return False
-    #         webhook_event = await webhook_events_crud.create_webhook_event(db, webhook_event_log)
-    #         if webhook_event:
-    #             return webhook_event
-    #         else:
-    #             logger.info(f"Error creating webhook_event log")
-    #     except Exception as e:
-    #         logger.error(f"Error getting subscription webhook_event: {str(e)}")
-    #         raise HTTPException(
-    #             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-    #             detail="An unexpected error occurred"
-    #         )
+    async def reserve_event(self, event_id: str) -> bool | None:
+        '''
+        SET NX reservation: False means duplicate, None means Redis unavailable
+        '''
+        return await redis_client.set_if_not_exists(
+            f"{EVENT_SEEN_KEY_PREFIX}{event_id}", "1", ttl=EVENT_SEEN_TTL
+        )
+
+    async def release_event(self, event_id: str) -> None:
+        await redis_client.delete(f"{EVENT_SEEN_KEY_PREFIX}{event_id}")
 
     async def check_and_create_webhook_event(
         self,
         webhook_data: WebhookEventCreate
     ) -> WebhookEventResponse | None:
-        if await self.uow.webhook_events.exists_by_event_id(webhook_data.event_id):
-            logger.info(f"Webhook event already exists: {webhook_data.event_id}")
-            return None
-        
-        webhook_event = await self.uow.webhook_events.create(
-            **webhook_data.model_dump()
-        )
-
-        await self.uow.commit()
-
-        logger.info(f"Created webhook event: {webhook_event.id}")
-        return WebhookEventResponse.model_validate(webhook_event)
+        # the caller holds the Redis reservation; Postgres stays the source of truth
+        try:
+            webhook_event = await self.uow.webhook_events.create_if_new(
+                **webhook_data.model_dump()
+            )
+
+            if webhook_event is None:
+                logger.info("Webhook event already exists: %s", webhook_data.event_id)
+                return None
+
+            await self.uow.commit()
+        except Exception:
+            # release the reservation so Solidgate's retry can get through
+            await self.release_event(webhook_data.event_id)
+            raise
+
+        logger.info("Created webhook event: %s", webhook_event.id)
+        return _row_to_response(webhook_event)
     
 async def get_idempotency_service(uow: UnitOfWork) -> IdempotencyService: 
     return IdempotencyService(uow)
\ No newline at end of file
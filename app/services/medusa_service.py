@@ -1,10 +1,13 @@
 import logging
 import asyncio
+import random
+import time
 from typing import Any
 
-import httpx
+import orjson
 
 from app.core.config import settings
+from app.core.http import http_client
 from app.core.redis import redis_client
 from fastapi import status
 from app.schemas.common import GenericApiResponse
@@ -13,20 +16,49 @@ logger = logging.getLogger(__name__)
 
 MEDUSA_TOKEN_KEY = "medusa:admin_token"
 
+# short re-check window for tokens read back from Redis, since GET does not
+# reveal the key's remaining TTL
+LOCAL_TOKEN_RECHECK = 60.0
+
+_SUCCESS_STATUSES = frozenset({
+    status.HTTP_200_OK,
+    status.HTTP_201_CREATED,
+    status.HTTP_204_NO_CONTENT,
+})
+
+def _parse_retry_after(value: str | None, default: float = 1.0, cap: float = 30.0) -> float:
+    if not value:
+        return default
+    try:
+        return min(max(float(value), 0.0), cap)
+    except ValueError:
+        return default
+
 class MedusaService:
     def __init__(self):
         self.base_url = settings.MEDUSA_BASE_URL
         self.email = settings.MEDUSA_ADMIN_EMAIL
         self.password = settings.MEDUSA_ADMIN_PASSWORD
         self.token_ttl = settings.MEDUSA_TOKEN_CACHE_TTL
+        self._auth_lock = asyncio.Lock()
+        self._local_token: tuple[str, float] | None = None
 
     async def _get_cached_token(self) -> str | None:
-        return await redis_client.get(MEDUSA_TOKEN_KEY)
+        if self._local_token and time.monotonic() < self._local_token[1]:
+            return self._local_token[0]
+
+        token = await redis_client.get(MEDUSA_TOKEN_KEY)
+        if token:
+            self._local_token = (token, time.monotonic() + LOCAL_TOKEN_RECHECK)
+        return token
 
     async def _cache_token(self, token: str) -> None:
+        # we just minted this token, so the full TTL is known
+        self._local_token = (token, time.monotonic() + self.token_ttl - 5)
         await redis_client.set(MEDUSA_TOKEN_KEY, token, ttl=self.token_ttl)
 
     async def _clear_token(self) -> None:
+        self._local_token = None
         await redis_client.delete(MEDUSA_TOKEN_KEY)
 
     async def authenticate(self, max_retries: int = 3) -> str | None:
@@ -35,17 +67,25 @@ class MedusaService:
             logger.info("Using cached medusa token")
             return cached_token
 
-        for attempt in range(max_retries):
-            try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
+        async with self._auth_lock:
+            # another coroutine may have refreshed while we waited on the lock
+            cached_token = await self._get_cached_token()
+            if cached_token:
+                return cached_token
+
+            for attempt in range(max_retries):
+                try:
+                    response = await http_client.client.post(
                         f"{self.base_url}/auth/user/emailpass",
-                        json={"email": self.email, "password": self.password},
+                        content=orjson.dumps(
+                            {"email": self.email, "password": self.password}
+                        ),
+                        headers={"Content-Type": "application/json"},
                         timeout=30.0,
                     )
 
                     if response.status_code == status.HTTP_200_OK:
-                        data = response.json()
+                        data = orjson.loads(response.content)
                         token = data.get("token")
 
                         if token:
@@ -53,22 +93,38 @@ class MedusaService:
                             logger.info("Medusa token cached")
                             return token
 
+                    if (
+                        status.HTTP_400_BAD_REQUEST
+                        <= response.status_code
+                        < status.HTTP_500_INTERNAL_SERVER_ERROR
+                        and response.status_code != status.HTTP_429_TOO_MANY_REQUESTS
+                    ):
+                        # bad credentials won't get better on retry
+                        logger.error(
+                            "Medusa auth rejected (%s), not retrying",
+                            response.status_code,
+                        )
+                        return None
+
                     logger.warning(
-                        f"Medusa auth attempt {attempt + 1}/{max_retries} failed: {response.status_code}"
+                        "Medusa auth attempt %s/%s failed: %s",
+                        attempt + 1, max_retries, response.status_code,
                     )
 
-            except Exception as e:
-                logger.warning(
-                    f"Medusa auth attempt {attempt + 1}/{max_retries} error: {e}"
-                )
+                except Exception as e:
+                    logger.warning(
+                        "Medusa auth attempt %s/%s error: %s",
+                        attempt + 1, max_retries, e,
+                    )
 
-            if attempt < max_retries - 1:
-                wait_time = 2**attempt
-                logger.info(f"Retrying in {wait_time} seconds...")
-                await asyncio.sleep(wait_time)
+                if attempt < max_retries - 1:
+                    # full jitter so blocked coroutines don't retry in lockstep
+                    wait_time = random.uniform(0, min(2**attempt, 4))
+                    logger.info("Retrying in %.2f seconds...", wait_time)
+                    await asyncio.sleep(wait_time)
 
-        logger.error(f"Medusa auth failed after {max_retries} attempts")
-        return None
+            logger.error("Medusa auth failed after %s attempts", max_retries)
+            return None
 
     async def execute_request(
         self,
@@ -77,6 +133,7 @@ class MedusaService:
         payload: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
         retry_on_401: bool = True,
+        retry_on_429: bool = True,
     ) -> GenericApiResponse:
         url = f"{self.base_url}{endpoint}"
         is_store_api = "/store/" in endpoint
@@ -94,67 +151,81 @@ class MedusaService:
                 )
             headers = {"Authorization": f"Bearer {token}"}
 
+        # pre-encode with orjson instead of letting httpx run stdlib json.dumps
+        content = None
+        if payload is not None:
+            content = orjson.dumps(payload)
+            headers["Content-Type"] = "application/json"
+
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.request(
+            response = await http_client.client.request(
+                method=method,
+                url=url,
+                content=content,
+                params=params,
+                headers=headers,
+                timeout=30.0,
+            )
+
+            if (
+                response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+                and retry_on_429
+            ):
+                wait_time = _parse_retry_after(response.headers.get("retry-after"))
+                logger.warning("Medusa rate limited, retrying in %ss", wait_time)
+                await asyncio.sleep(wait_time)
+                return await self.execute_request(
+                    endpoint=endpoint,
                     method=method,
-                    url=url,
-                    json=payload,
+                    payload=payload,
                     params=params,
-                    headers=headers,
-                    timeout=30.0,
+                    retry_on_401=retry_on_401,
+                    retry_on_429=False,
                 )
 
-                if (
-                    response.status_code == status.HTTP_401_UNAUTHORIZED
-                    and retry_on_401
-                    and not is_store_api
-                ):
-                    await self._clear_token()
-                    logger.warning("Token expired, retrying")
-                    return await self.execute_request(
-                        endpoint=endpoint,
-                        method=method,
-                        payload=payload,
-                        params=params,
-                        retry_on_401=False,
-                    )
-
-                if response.status_code in [
-                    status.HTTP_201_CREATED,
-                    status.HTTP_200_OK,
-                    status.HTTP_204_NO_CONTENT,
-                ]:
-                    data = {}
-                    if (
-                        response.status_code != status.HTTP_204_NO_CONTENT
-                        and response.text.strip()
-                    ):
-                        data = response.json()
-
-                    return GenericApiResponse(
-                        success=True,
-                        message=f"Calling {endpoint} successful",
-                        status_code=response.status_code,
-                        data=data,
-                    )
+            if (
+                response.status_code == status.HTTP_401_UNAUTHORIZED
+                and retry_on_401
+                and not is_store_api
+            ):
+                await self._clear_token()
+                logger.warning("Token expired, retrying")
+                return await self.execute_request(
+                    endpoint=endpoint,
+                    method=method,
+                    payload=payload,
+                    params=params,
+                    retry_on_401=False,
+                )
 
-                error_data = {}
-                if response.text.strip():
-                    try:
-                        error_data = response.json()
-                    except Exception:
-                        error_data = {"message": response.text}
+            if response.status_code in _SUCCESS_STATUSES:
+                body = response.content
+                data = orjson.loads(body) if body.strip() else {}
 
                 return GenericApiResponse(
-                    success=False,
-                    message=f"Request to {endpoint} failed",
+                    success=True,
+                    message=f"Calling {endpoint} successful",
                     status_code=response.status_code,
-                    data=error_data,
+                    data=data,
                 )
 
+            body = response.content
+            error_data = {}
+            if body.strip():
+                try:
+                    error_data = orjson.loads(body)
+                except Exception:
+                    error_data = {"message": body.decode("utf-8", "replace")}
+
+            return GenericApiResponse(
+                success=False,
+                message=f"Request to {endpoint} failed",
+                status_code=response.status_code,
+                data=error_data,
+            )
+
         except Exception as e:
-            logger.error(f"Request error: {e}")
+            logger.error("Request error: %s", e)
             return GenericApiResponse(
                 success=False,
                 message=f"Request to {endpoint} failed: {str(e)}",
@@ -169,39 +240,46 @@ class MedusaService:
         )
 
         if not result.success:
-            logger.error(f"Complete cart failed: {result.message}")
+            logger.error("Complete cart failed: %s", result.message)
             return None
 
         if result.data.get("type") != "order":
-            logger.warning(f"Cart not ready for completion: {cart_id}")
+            logger.warning("Cart not ready for completion: %s", cart_id)
             return None
 
         order = result.data.get("order", {})
         order_id = order.get("id")
 
-        logger.info(f"Cart completed, order created: {order_id}")
+        logger.info("Cart completed, order created: %s", order_id)
         return {"order_id": order_id}
 
-    async def get_payment_session_id_from_cart(self, cart_id: str) -> str | None:
+    async def get_payment_ids_from_cart(self, cart_id: str) -> dict | None:
         result = await self.execute_request(
             endpoint=f"/store/carts/{cart_id}",
             method="GET",
-            params={"fields": "+payment_collection.payment_sessions"},
+            params={
+                "fields": "+payment_collection.payment_sessions,+payment_collection.payments.id"
+            },
         )
 
         if not result.success:
-            logger.error(f"Get cart failed: {result.message}")
+            logger.error("Get cart failed: %s", result.message)
             return None
 
         cart = result.data.get("cart", {})
         payment_collection = cart.get("payment_collection", {})
-        payment_sessions = payment_collection.get("payment_sessions", [])
 
-        if payment_sessions:
-            return payment_sessions[0].get("id")
+        payments = payment_collection.get("payments") or []
+        payment_sessions = payment_collection.get("payment_sessions") or []
 
-        logger.warning(f"No payment session found for cart: {cart_id}")
-        return None
+        payment_id = payments[0].get("id") if payments else None
+        payment_session_id = payment_sessions[0].get("id") if payment_sessions else None
+
+        if not payment_id and not payment_session_id:
+            logger.warning("No payment info found for cart: %s", cart_id)
+            return None
+
+        return {"payment_id": payment_id, "payment_session_id": payment_session_id}
 
     async def get_payment_id_by_session(self, payment_session_id: str) -> str | None:
         result = await self.execute_request(
@@ -211,14 +289,14 @@ class MedusaService:
         )
 
         if not result.success:
-            logger.error(f"Failed to look up payment for session: {payment_session_id}")
+            logger.error("Failed to look up payment for session: %s", payment_session_id)
             return None
 
         payments = result.data.get("payments", [])
         if payments:
             return payments[0].get("id")
 
-        logger.warning(f"No payment found for session: {payment_session_id}")
+        logger.warning("No payment found for session: %s", payment_session_id)
         return None
 
     async def capture_payment(self, payment_id: str) -> dict | None:
@@ -228,10 +306,10 @@ class MedusaService:
         )
 
         if not result.success:
-            logger.error(f"Capture failed: {result.message}")
+            logger.error("Capture failed: %s", result.message)
             return None
 
-        logger.info(f"Payment captured: {payment_id}")
+        logger.info("Payment captured: %s", payment_id)
         return result.data.get("payment")
 
     async def process_settle_ok(self, cart_id: str) -> GenericApiResponse | None:
@@ -240,30 +318,38 @@ class MedusaService:
         '''
         complete_result = await self.complete_cart(cart_id)
         if not complete_result:
-            logger.error(f"Failed to complete cart: {cart_id}")
+            logger.error("Failed to complete cart: %s", cart_id)
             return None
 
         order_id = complete_result.get("order_id")
         if not order_id:
-            logger.error(f"No order_id found for cart: {cart_id}")
+            logger.error("No order_id found for cart: %s", cart_id)
             return None
 
-        payment_session_id = await self.get_payment_session_id_from_cart(cart_id)
-        if not payment_session_id:
-            logger.error(f"No payment_session_id found for cart: {cart_id}")
+        payment_info = await self.get_payment_ids_from_cart(cart_id)
+        if not payment_info:
+            logger.error("No payment info found for cart: %s", cart_id)
             return None
 
-        payment_id = await self.get_payment_id_by_session(payment_session_id)
+        payment_id = payment_info.get("payment_id")
         if not payment_id:
-            logger.error(f"No payment_id found for session: {payment_session_id}")
-            return None
+            # older Medusa versions don't expand payments on the cart; fall back
+            payment_session_id = payment_info.get("payment_session_id")
+            if not payment_session_id:
+                logger.error("No payment_session_id found for cart: %s", cart_id)
+                return None
+
+            payment_id = await self.get_payment_id_by_session(payment_session_id)
+            if not payment_id:
+                logger.error("No payment_id found for session: %s", payment_session_id)
+                return None
 
         capture_result = await self.capture_payment(payment_id)
         if not capture_result:
-            logger.error(f"Failed to capture payment: {payment_id}")
+            logger.error("Failed to capture payment: %s", payment_id)
             return None
 
-        logger.info(f"Successfully settled order: {order_id}")
+        logger.info("Successfully settled order: %s", order_id)
         return GenericApiResponse(
             success=True,
             message=f"{order_id} successfully settled",
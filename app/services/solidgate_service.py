@@ -3,14 +3,18 @@ import json
 import logging
 from typing import Any
 
-import httpx
+import orjson
+
 from solidgate import ApiClient
 
 from app.core.config import settings
+from app.core.http import http_client
 from app.core.security import SignatureService
 
 logger = logging.getLogger(__name__)
 
+_OK_STATUSES = frozenset({200, 201, 204})
+
 
 class SolidgateService:
     def __init__(self):
@@ -18,6 +22,11 @@ class SolidgateService:
         self.secret_key = settings.SOLIDGATE_SECRET_KEY
         self.client = ApiClient(self.public_key, self.secret_key)
         self.signature_service = SignatureService(self.public_key, self.secret_key)
+        # only the Signature header varies per request
+        self._base_headers = {
+            "Content-Type": "application/json",
+            "merchant": self.public_key,
+        }
 
     def generate_signature(self, payload: str, method: str = "POST") -> str:
         return self.signature_service.generate_signature(payload, method)
@@ -31,61 +40,55 @@ class SolidgateService:
         payload: dict[str, Any] | None = None,
         method: str = "POST"
     ) -> dict[str, Any]:
-        async with httpx.AsyncClient() as client:
-            payload_json = ""
-            if payload:
-                payload_json = json.dumps(
-                    payload,
-                    separators=(",", ":"),
-                    sort_keys=True,
-                    ensure_ascii=True
-                )
-
-            signature = self.generate_signature(payload_json, method)
-
-            headers = {
-                "Content-Type": "application/json",
-                "merchant": self.public_key,
-                "Signature": signature
-            }
-
-            try:
-                if method == "GET":
-                    response = await client.get(endpoint, headers=headers, timeout=30.0)
-                elif method == "DELETE":
-                    response = await client.delete(endpoint, headers=headers, timeout=30.0)
-                else:
-                    response = await client.request(
-                        method=method,
-                        url=endpoint,
-                        content=payload_json,
-                        headers=headers,
-                        timeout=30.0
-                    )
-
-                if response.status_code in [200, 201, 204]:
-                    result_data = {}
-                    if response.status_code != 204 and response.text.strip():
-                        try:
-                            result_data = response.json()
-                        except Exception:
-                            result_data = {}
-
-                    if "error" in result_data:
-                        return {"success": False, "status_code": response.status_code, "data": result_data}
-
-                    return {"success": True, "status_code": response.status_code, "data": result_data}
-                else:
+        client = http_client.client
+
+        payload_json = ""
+        if payload:
+            payload_json = json.dumps(
+                payload,
+                separators=(",", ":"),
+                sort_keys=True,
+                ensure_ascii=True
+            )
+
+        signature = self.generate_signature(payload_json, method)
+
+        headers = {**self._base_headers, "Signature": signature}
+
+        try:
+            response = await client.request(
+                method=method,
+                url=endpoint,
+                content=payload_json or None,
+                headers=headers,
+                timeout=30.0
+            )
+
+            body = response.content
+
+            if response.status_code in _OK_STATUSES:
+                result_data = {}
+                if response.status_code != 204 and body.strip():
                     try:
-                        result_data = response.json() if response.text.strip() else {"error": f"HTTP {response.status_code}"}
+                        result_data = orjson.loads(body)
                     except Exception:
-                        result_data = {"error": f"HTTP {response.status_code}"}
+                        result_data = {}
 
+                if "error" in result_data:
                     return {"success": False, "status_code": response.status_code, "data": result_data}
 
-            except Exception as e:
-                logger.error(f"Request error: {e}")
-                return {"success": False, "status_code": 0, "error": {"message": str(e)}}
+                return {"success": True, "status_code": response.status_code, "data": result_data}
+            else:
+                try:
+                    result_data = orjson.loads(body) if body.strip() else {"error": f"HTTP {response.status_code}"}
+                except Exception:
+                    result_data = {"error": f"HTTP {response.status_code}"}
+
+                return {"success": False, "status_code": response.status_code, "data": result_data}
+
+        except Exception as e:
+            logger.error("Request error: %s", e)
+            return {"success": False, "status_code": 0, "error": {"message": str(e)}}
 
     def create_payment_intent(
         self,
@@ -109,7 +112,7 @@ class SolidgateService:
 
         merchant_data = self.client.form_merchant_data(intent)
 
-        print(f"merchant_data: {merchant_data}")
+        logger.debug("Formed merchant data for order: %s", order_id)
 
         return {
             "payment_intent": merchant_data.payment_intent,
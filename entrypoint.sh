@@ -32,5 +32,7 @@ if [ "$RUN_MIGRATIONS" = "true" ]; then
 fi
 
 echo "Starting FastAPI server..."
-exec uvicorn app.main:app --host 0.0.0.0 --port 8001
+exec uvicorn app.main:app --host 0.0.0.0 --port 8001 \
+    --loop uvloop --http httptools \
+    --workers "${WEB_CONCURRENCY:-2}" --backlog 2048
 